@@ -4,7 +4,7 @@
 # - Installs Xcode CLI tools (if needed)
 # - Installs Homebrew (if missing)
 # - Installs brew packages: python@3.11, qemu, cdrtools, coreutils
-# - Installs Python packages into user site: requests, beautifulsoup4, tqdm
+# - Installs Python packages into user site: requests, beautifulsoup4, lxml, tqdm, isal
 #
 # Usage:
 #   chmod +x bootstrap-mbp-lab.sh
@@ -18,7 +18,7 @@ set -euo pipefail
 
 # Config
 BREW_PKGS=(python@3.11 qemu cdrtools coreutils)
-PY_PKGS=(requests beautifulsoup4 tqdm)
+PY_PKGS=(requests beautifulsoup4 lxml tqdm isal)
 SCRIPT_NAME="$(basename "$0")"
 
 # Helpers
@@ -221,7 +221,7 @@ post_checks() {
   echoinfo "Python libs:"
   python3 - <<'PY' || true
 import importlib, sys
-libs = ['requests','bs4','tqdm']
+libs = ['requests','bs4','lxml','tqdm','isal']
 for l in libs:
     try:
         importlib.import_module(l)
@@ -9,34 +9,101 @@ Rules:
   - If --copies N > 1: append -1, -2, … to each copy’s name
   - Renames .utm folder(s) and sets internal config.plist 'name'
 
+Optional speedups (used automatically when installed):
+  - hayazip: multi-threaded ZIP extraction
+  - isal:    ISA-L inflate for the stdlib zipfile fallback
+  - orjson:  faster parsing of the gallery's Next.js data
+
 Usage examples:
   ./utm-gallery-get.py
   ./utm-gallery-get.py --copies 3
   ./utm-gallery-get.py --name LAB-VICTIM --copies 2
+  ./utm-gallery-get.py --stream
 """
 
-import sys, os, time, glob, shutil, zipfile, plistlib, random, json
+import sys, os, re, time, shutil, zipfile, plistlib, random, json
+import functools, hashlib, tempfile, ctypes, subprocess
+from html import unescape
+from xml.sax.saxutils import escape
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
+try:
+    import lxml  # noqa: F401  C-backed parser, much faster than html.parser
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import hayazip
+except ImportError:
+    hayazip = None
+
+try:
+    from isal import isal_zlib
+    zipfile.zlib = isal_zlib  # drop-in inflate, several times faster than zlib
+except ImportError:
+    pass
+
 GALLERY_BASE = "https://mac.getutm.app/gallery/"
 HEADERS = {"User-Agent": "utm-gallery-get/1.3 (+https://getutm.app)"}
-
-ADJECTIVES = [
+FETCH_WORKERS = 16
+POOL_SIZE = 32
+DOWNLOAD_CHUNK = 1 << 20  # 1 MiB reads keep per-chunk Python overhead negligible
+PROGRESS_STEP = 4 << 20   # batch progress-bar updates to every 4 MiB
+ZIP_READ_BUFFER = 1 << 20
+CACHE_DIR = os.path.expanduser("~/.cache/utm-gallery-get")
+CACHE_TTL = 3600  # seconds; 0 disables the on-disk page cache
+
+# Memoized URL helpers for the gallery walk.
+cached_urljoin = functools.lru_cache(maxsize=1024)(urljoin)
+cached_urlparse = functools.lru_cache(maxsize=1024)(urlparse)
+
+# Plain href scans don't need a DOM; these run straight over the page text.
+# Earlier attributes are skipped whole (so quoted values may contain '>'), and
+# href must be its own attribute, quoted either way or unquoted.
+_ANCHOR_TO_HREF = r'''<a(?:\s+[^\s"'<>/=]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'>]+))?)*?\s+href\s*=\s*'''
+HREF_RE = re.compile(_ANCHOR_TO_HREF + r'''(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''', re.I)
+ZIP_HREF_RE = re.compile(_ANCHOR_TO_HREF + r'''(?:"([^"]*\.zip)"|'([^']*\.zip)'|([^\s"'>]*\.zip)(?![^\s"'>]))''', re.I)
+HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+PLIST_NAME_RE = re.compile(rb"(<key>name</key>\s*<string>)[^<]*(</string>)")
+NEXT_DATA_RE = re.compile(r'''<script[^>]*\sid\s*=\s*["']?__NEXT_DATA__["']?[^>]*>(.*?)</script>''', re.I | re.S)
+
+# Transient connect/read errors and 5xx replies are retried on the pooled
+# connection with backoff; the final response still goes to raise_for_status().
+RETRY = Retry(total=3, connect=3, read=2, backoff_factor=0.3,
+              status_forcelist=(500, 502, 503, 504),
+              allowed_methods=frozenset(["GET"]), raise_on_status=False)
+
+# One keep-alive session for every request so TCP/TLS connections are reused.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE,
+                                      max_retries=RETRY))
+
+ADJECTIVES = (
     "amber","arcane","brisk","cerulean","crimson","dapper","dusky","ember",
     "feral","fluid","gilded","glacial","jade","lunar","mint","nocturne",
     "opal","primal","quartz","rapid","scarlet","silken","silver","stealthy",
     "swift","vivid","zenith"
-]
-NOUNS = [
+)
+NOUNS = (
     "comet","cipher","falcon","harbor","horizon","kernel","lantern","matrix",
     "nebula","octave","onyx","packet","prairie","quasar","quill","raven",
     "relay","saber","sentinel","spire","synergy","talon","turbine","vertex",
     "willow","zephyr"
-]
+)
 
 def rand_name():
     return f"{random.choice(ADJECTIVES)}-{random.choice(NOUNS)}"
@@ -59,42 +126,103 @@ def parse_args():
     ap.add_argument("--downloads", default=os.path.expanduser("~/Downloads"), help="Download dir")
     ap.add_argument("--utm-docs", default=default_utm_docs(),
                     help="UTM Documents dir (App Store or direct-download)")
-    return ap.parse_args()
-
-def fetch(url):
-    r = requests.get(url, headers=HEADERS, timeout=20)
+    ap.add_argument("--stream", action="store_true",
+                    help="Extract while downloading via bsdtar instead of saving the ZIP first")
+    ap.add_argument("--cache-ttl", type=int, default=CACHE_TTL,
+                    help=f"Seconds to reuse cached gallery pages, 0 to always refetch (default {CACHE_TTL})")
+    args = ap.parse_args()
+    if args.copies < 1:
+        ap.error("--copies must be at least 1")
+    return args
+
+def _cache_path(url):
+    return os.path.join(CACHE_DIR, hashlib.blake2b(url.encode(), digest_size=16).hexdigest())
+
+def _cache_read(url, ttl):
+    path = _cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+    except (OSError, ValueError):
+        pass  # missing, unreadable or corrupt entry: refetch it
+    return None
+
+def _cache_write(url, text):
+    tmp = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, prefix=".tmp-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, _cache_path(url))
+    except (OSError, ValueError):
+        # caching is best-effort; just don't leave the temp file behind
+        if tmp:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+@functools.lru_cache(maxsize=None)
+def fetch(url, cache_ttl=CACHE_TTL):
+    if cache_ttl > 0:
+        text = _cache_read(url, cache_ttl)
+        if text is not None:
+            return text
+    r = SESSION.get(url, timeout=20)
     r.raise_for_status()
+    if cache_ttl > 0:
+        _cache_write(url, r.text)
     return r.text
 
+def _safe_fetch(url, cache_ttl=CACHE_TTL):
+    try:
+        return fetch(url, cache_ttl)
+    except Exception:
+        return None
+
+def fetch_all(urls, cache_ttl=CACHE_TTL):
+    """Fetch pages concurrently; returns {url: html or None on failure}."""
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(urls))) as ex:
+        return dict(zip(urls, ex.map(lambda u: _safe_fetch(u, cache_ttl), urls)))
+
 def gather_zip_links(node):
+    # Iterative pre-order walk: same link order as recursion, no depth limit.
     links = []
-    if isinstance(node, str):
-        if node.lower().endswith(".zip"):
-            links.append(node)
-    elif isinstance(node, dict):
-        for v in node.values():
-            links.extend(gather_zip_links(v))
-    elif isinstance(node, (list, tuple, set)):
-        for item in node:
-            links.extend(gather_zip_links(item))
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            if node.lower().endswith(".zip"):
+                links.append(node)
+        elif isinstance(node, dict):
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, (list, tuple, set)):
+            stack.extend(reversed(list(node)))
     return links
 
 
 def extract_from_next_data(index_html):
     """Parse Next.js hydration data when available to enumerate gallery items."""
-    soup = BeautifulSoup(index_html, "html.parser")
-    script = soup.find("script", id="__NEXT_DATA__")
-    if not script or not script.string:
+    m = NEXT_DATA_RE.search(index_html)
+    if not m or not m.group(1).strip():
         return []
 
     try:
-        data = json.loads(script.string)
-    except json.JSONDecodeError:
+        data = json_loads(m.group(1))
+    except ValueError:
         return []
 
     items = {}
+    base = GALLERY_BASE
 
-    def visit(node):
+    stack = [data]
+    while stack:
+        node = stack.pop()
         if isinstance(node, dict):
             slug = node.get("path") or node.get("url") or node.get("slug")
             zips = gather_zip_links(node.get("downloads")) if "downloads" in node else []
@@ -105,11 +233,11 @@ def extract_from_next_data(index_html):
 
             if slug and zips:
                 if isinstance(slug, str):
-                    page = slug if slug.startswith("http") else urljoin(GALLERY_BASE, slug.lstrip("/"))
+                    page = slug if slug.startswith("http") else cached_urljoin(base, slug.lstrip("/"))
                 else:
                     page = None
-                if page and page.startswith(GALLERY_BASE):
-                    title = node.get("title") or node.get("name") or os.path.basename(urlparse(page).path)
+                if page and page.startswith(base):
+                    title = node.get("title") or node.get("name") or os.path.basename(cached_urlparse(page).path)
                     norm_page = page.rstrip("/")
                     existing = items.get(norm_page)
                     if existing:
@@ -117,13 +245,10 @@ def extract_from_next_data(index_html):
                     else:
                         items[norm_page] = {"title": title, "page": page, "zips": list(zips)}
 
-            for value in node.values():
-                visit(value)
+            # Push children reversed so they are visited in document order.
+            stack.extend(reversed(list(node.values())))
         elif isinstance(node, (list, tuple, set)):
-            for value in node:
-                visit(value)
-
-    visit(data)
+            stack.extend(reversed(list(node)))
 
     # Deduplicate and normalize zip URLs
     normalized = []
@@ -131,7 +256,7 @@ def extract_from_next_data(index_html):
         unique_zips = []
         seen = set()
         for link in item["zips"]:
-            resolved = urljoin(item["page"], link) if not urlparse(link).scheme else link
+            resolved = cached_urljoin(item["page"], link) if not cached_urlparse(link).scheme else link
             if resolved not in seen:
                 seen.add(resolved)
                 unique_zips.append(resolved)
@@ -140,6 +265,12 @@ def extract_from_next_data(index_html):
     return normalized
 
 
+def find_hrefs(pattern, html):
+    """Entity-decoded href values matched by one of the *HREF_RE patterns."""
+    html = HTML_COMMENT_RE.sub("", html)
+    return [unescape(next(g for g in m.groups() if g is not None))
+            for m in pattern.finditer(html)]
+
 def find_vm_pages(index_html):
     """Return gallery entries discovered on the landing page."""
     # Prefer structured data embedded in the page when available.
@@ -148,13 +279,12 @@ def find_vm_pages(index_html):
         return items
 
     # Fallback to scraping anchor tags when the structured data is unavailable.
-    soup = BeautifulSoup(index_html, "html.parser")
     links = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
+    base = GALLERY_BASE
+    for href in find_hrefs(HREF_RE, index_html):
         if "/gallery/" in href or href.strip("/").endswith((".html", "/")):
-            full = urljoin(GALLERY_BASE, href)
-            if full.startswith(GALLERY_BASE):
+            full = cached_urljoin(base, href)
+            if full.startswith(base):
                 links.append(full)
     seen, out = set(), []
     for link in links:
@@ -164,56 +294,158 @@ def find_vm_pages(index_html):
     return out
 
 def find_zip_for_page(page_html, page_url):
-    soup = BeautifulSoup(page_html, "html.parser")
-    return [urljoin(page_url, a["href"]) for a in soup.find_all("a", href=True) if a["href"].lower().endswith(".zip")]
+    return [urljoin(page_url, href) for href in find_hrefs(ZIP_HREF_RE, page_html)]
 
-def download_file(url, outpath):
-    with requests.get(url, stream=True, headers=HEADERS, timeout=60) as r:
+def _copy_response(url, f, desc):
+    with SESSION.get(url, stream=True, timeout=60) as r:
         r.raise_for_status()
         total = int(r.headers.get("Content-Length", 0))
-        with open(outpath, "wb") as f, tqdm(
+        with tqdm(
             total=total if total>0 else None,
-            unit='B', unit_scale=True, desc=os.path.basename(outpath)
+            unit='B', unit_scale=True, desc=desc,
+            mininterval=0.2, maxinterval=1.0
         ) as pbar:
-            for chunk in r.iter_content(chunk_size=128*1024):
-                if chunk:
-                    f.write(chunk)
-                    if total>0: pbar.update(len(chunk))
+            r.raw.decode_content = True
+            buf = bytearray(DOWNLOAD_CHUNK)
+            view = memoryview(buf)
+            pending = 0
+            while True:
+                n = r.raw.readinto(buf)
+                if not n:
+                    break
+                f.write(view[:n])
+                pending += n
+                if pending >= PROGRESS_STEP:
+                    if total>0: pbar.update(pending)
+                    pending = 0
+            if total>0 and pending: pbar.update(pending)
+
+def download_file(url, outpath):
+    with open(outpath, "wb") as f:
+        _copy_response(url, f, os.path.basename(outpath))
     return outpath
 
+def bsdtar_path():
+    """bsdtar can unpack a ZIP from a pipe; macOS ships it as /usr/bin/tar."""
+    tar = shutil.which("bsdtar")
+    if not tar and sys.platform == "darwin" and os.path.exists("/usr/bin/tar"):
+        tar = "/usr/bin/tar"
+    return tar
+
+def stream_extract(url, dest_dir, tar):
+    """Pipe the download straight into bsdtar so no ZIP is written to disk."""
+    proc = subprocess.Popen([tar, "-xf", "-", "-C", dest_dir], stdin=subprocess.PIPE)
+    try:
+        _copy_response(url, proc.stdin, os.path.basename(urlparse(url).path))
+    finally:
+        proc.stdin.close()
+        rc = proc.wait()
+    if rc != 0:
+        raise subprocess.CalledProcessError(rc, tar)
+
+def list_utms(d):
+    """Paths of the *.utm entries in d, from one directory listing (no stat calls)."""
+    with os.scandir(d) as it:
+        return {e.path for e in it if e.name.endswith(".utm") and not e.name.startswith(".")}
+
+def newest_first(paths):
+    """Sort paths by mtime, newest first; entries that can't be stat'ed are dropped."""
+    mtimes = {}
+    for p in paths:
+        try:
+            mtimes[p] = os.path.getmtime(p)
+        except OSError:
+            pass  # e.g. a dangling symlink
+    return sorted(mtimes, key=mtimes.get, reverse=True)
+
 def extract_zip_to(zip_path, dest_dir):
-    with zipfile.ZipFile(zip_path, 'r') as zf:
-        zf.extractall(dest_dir)
-    return sorted(glob.glob(os.path.join(dest_dir, "*.utm")), key=lambda p: os.path.getmtime(p), reverse=True)
+    if hayazip is not None:
+        hayazip.extract_zip(zip_path, dest_dir)
+    else:
+        # A 1 MiB read buffer turns the many small header/central-directory reads into few syscalls.
+        with open(zip_path, "rb", buffering=ZIP_READ_BUFFER) as fh, zipfile.ZipFile(fh, 'r') as zf:
+            zf.extractall(dest_dir)
+    return newest_first(list_utms(dest_dir))
+
+def _rename_xml_plist(data, new_name):
+    """Swap the top-level 'name' string in XML plist bytes; None if it isn't there."""
+    for m in PLIST_NAME_RE.finditer(data):
+        head = data[:m.start()]
+        if head.count(b"<dict>") - head.count(b"</dict>") == 1:
+            value = escape(new_name).encode("utf-8")
+            return data[:m.start(1)] + m.group(1) + value + m.group(2) + data[m.end(2):]
+    return None
 
 def set_vm_display_name(utm_pkg_path, new_name):
     cfg = os.path.join(utm_pkg_path, "config.plist")
     if not os.path.isfile(cfg): return
     with open(cfg, "rb") as f:
-        data = plistlib.load(f)
-    data["name"] = new_name
-    with open(cfg, "wb") as f:
-        plistlib.dump(data, f)
+        raw = f.read()
+    new = _rename_xml_plist(raw, new_name)
+    if new is None:
+        # Binary plist or no existing key: fall back to a full round-trip.
+        data = plistlib.loads(raw)
+        data["name"] = new_name
+        new = plistlib.dumps(data)
+    if new != raw:
+        tmp = cfg + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(new)
+        os.replace(tmp, cfg)
+
+def _clonefile(src, dst):
+    """APFS copy-on-write clone of a whole tree via clonefile(2); False if unsupported."""
+    if sys.platform != "darwin":
+        return False
+    try:
+        libc = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True)
+        return libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    except (OSError, AttributeError):
+        return False
+
+def _cp_command(src, dst):
+    """Native cp: copyfile(3) on macOS, reflink-when-possible on GNU coreutils."""
+    if sys.platform == "darwin":
+        return ["/bin/cp", "-pR", src, dst]
+    if sys.platform.startswith("linux") and shutil.which("cp"):
+        return ["cp", "--reflink=auto", "-pR", src, dst]
+    return None
+
+def fast_copytree(src, dst):
+    if _clonefile(src, dst):
+        return dst
+    cmd = _cp_command(src, dst)
+    if cmd:
+        if subprocess.run(cmd).returncode == 0:
+            return dst
+        shutil.rmtree(dst, ignore_errors=True)
+    # Last resort only: no usable cp, or cp failed.
+    return shutil.copytree(src, dst)
 
 def unique_path(path):
-    if not os.path.exists(path):
+    d, name = os.path.split(path)
+    try:
+        # One listing instead of a stat per candidate; lowercased since APFS is case-insensitive.
+        with os.scandir(d or ".") as it:
+            existing = {e.name.lower() for e in it}
+    except FileNotFoundError:
         return path
-    base, ext = os.path.splitext(path)
+    if name.lower() not in existing:
+        return path
+    base, ext = os.path.splitext(name)
     i = 2
-    while True:
-        candidate = f"{base}-{i}{ext}"
-        if not os.path.exists(candidate):
-            return candidate
+    while f"{base}-{i}{ext}".lower() in existing:
         i += 1
+    return os.path.join(d, f"{base}-{i}{ext}")
 
 def main():
     args = parse_args()
 
     print("Fetching UTM gallery index…")
-    idx_html = fetch(GALLERY_BASE)
+    idx_html = fetch(GALLERY_BASE, args.cache_ttl)
     discovered = find_vm_pages(idx_html)
 
-    items = []
+    entries = []
     for entry in discovered:
         if isinstance(entry, dict):
             page_url = entry.get("page") or entry.get("url")
@@ -227,14 +459,25 @@ def main():
         if not page_url:
             continue
 
-        if not urlparse(page_url).scheme:
-            page_url = urljoin(GALLERY_BASE, page_url.lstrip("/"))
+        if not cached_urlparse(page_url).scheme:
+            page_url = cached_urljoin(GALLERY_BASE, page_url.lstrip("/"))
+
+        entries.append((page_url, title_hint, zips))
 
-        page_html = None
+    # Fetch every page we still need (for zips or a title) in parallel, then parse serially.
+    pages = fetch_all((p for p, t, z in entries if not z or t is None), args.cache_ttl)
+
+    # Deduplicate by page URL in case multiple sources returned the same entry;
+    # skipping repeats here also avoids re-parsing their pages.
+    items = []
+    seen_pages = set()
+    for page_url, title_hint, zips in entries:
+        page_key = page_url.rstrip("/")
+        if page_key in seen_pages:
+            continue
+        page_html = pages.get(page_url)
         if not zips:
-            try:
-                page_html = fetch(page_url)
-            except Exception:
+            if page_html is None:
                 continue
             zips = find_zip_for_page(page_html, page_url)
 
@@ -243,57 +486,46 @@ def main():
 
         title_text = title_hint
         if title_text is None:
-            if page_html is None:
-                try:
-                    page_html = fetch(page_url)
-                except Exception:
-                    page_html = ""
-            soup = BeautifulSoup(page_html, "html.parser") if page_html else None
+            soup = BeautifulSoup(page_html, HTML_PARSER) if page_html else None
             title = None
             if soup:
                 title = soup.find(["h1", "h2"])
             title_text = title.get_text().strip() if title else page_url
 
+        seen_pages.add(page_key)
         items.append({"title": title_text, "page": page_url, "zips": zips})
 
     if not items:
         print("No downloadable VMs found.")
         sys.exit(1)
 
-    # Deduplicate by page URL in case multiple sources returned the same entry.
-    deduped = []
-    seen_pages = set()
-    for item in items:
-        page_key = item["page"].rstrip("/")
-        if page_key not in seen_pages:
-            seen_pages.add(page_key)
-            deduped.append(item)
-
-    if not deduped:
-        print("No downloadable VMs found.")
-        sys.exit(1)
-
     print("\nAvailable VMs:")
-    for i, it in enumerate(deduped, start=1):
+    for i, it in enumerate(items, start=1):
         print(f"{i:2d}. {it['title']}")
         for z in it['zips']:
             print(f"     → {z}")
     sel = input("\nEnter number to download (or q): ").strip().lower()
     if sel == 'q': sys.exit(0)
-    choice = deduped[int(sel)-1]
+    choice = items[int(sel)-1]
     zipurl = choice['zips'][0]
 
-    os.makedirs(args.downloads, exist_ok=True)
-    outzip = os.path.join(args.downloads, os.path.basename(urlparse(zipurl).path))
-    print(f"Downloading {zipurl} → {outzip}")
-    download_file(zipurl, outzip)
-
     os.makedirs(args.utm_docs, exist_ok=True)
-    print(f"Extracting into {args.utm_docs} …")
-    before = set(glob.glob(os.path.join(args.utm_docs, "*.utm")))
-    extract_zip_to(outzip, args.utm_docs)
-    after = set(glob.glob(os.path.join(args.utm_docs, "*.utm")))
-    created = sorted(list(after - before), key=lambda p: os.path.getmtime(p), reverse=True)
+    before = list_utms(args.utm_docs)
+    tar = bsdtar_path() if args.stream else None
+    if args.stream and not tar:
+        print("bsdtar not found; falling back to download then extract.")
+    if tar:
+        print(f"Streaming {zipurl} → {args.utm_docs} …")
+        stream_extract(zipurl, args.utm_docs, tar)
+    else:
+        os.makedirs(args.downloads, exist_ok=True)
+        outzip = os.path.join(args.downloads, os.path.basename(urlparse(zipurl).path))
+        print(f"Downloading {zipurl} → {outzip}")
+        download_file(zipurl, outzip)
+
+        print(f"Extracting into {args.utm_docs} …")
+        extract_zip_to(outzip, args.utm_docs)
+    created = newest_first(list_utms(args.utm_docs) - before)
     if not created:
         print("No .utm package found after extraction.")
         sys.exit(1)
@@ -305,17 +537,27 @@ def main():
         base_name = f"{rand_name()}-{time.strftime('%Y%m%d-%H%M%S')}"
 
     src_pkg = created[0]
-    installs = []
-    for i in range(1, args.copies+1):
-        vm_name = base_name if args.copies == 1 else f"{base_name}-{i}"
-        dst_pkg = unique_path(os.path.join(args.utm_docs, f"{vm_name}.utm"))
-        if i == 1:
-            if os.path.abspath(src_pkg) != os.path.abspath(dst_pkg):
-                shutil.move(src_pkg, dst_pkg)
-        else:
-            shutil.copytree(installs[0][0], dst_pkg)
-        set_vm_display_name(dst_pkg, vm_name)
-        installs.append((dst_pkg, vm_name))
+    names = [base_name] if args.copies == 1 else [f"{base_name}-{i}" for i in range(1, args.copies+1)]
+    first_name = names[0]
+    first_pkg = unique_path(os.path.join(args.utm_docs, f"{first_name}.utm"))
+    if os.path.abspath(src_pkg) != os.path.abspath(first_pkg):
+        try:
+            os.rename(src_pkg, first_pkg)  # same directory, so normally a metadata-only rename
+        except OSError:
+            shutil.move(src_pkg, first_pkg)
+    set_vm_display_name(first_pkg, first_name)
+
+    # Pick the remaining destinations up front so parallel copies can't race for a name.
+    installs = [(first_pkg, first_name)]
+    installs += [(unique_path(os.path.join(args.utm_docs, f"{n}.utm")), n) for n in names[1:]]
+
+    def make_copy(install):
+        fast_copytree(first_pkg, install[0])
+        set_vm_display_name(*install)
+
+    if len(installs) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(installs) - 1, os.cpu_count() or 1)) as ex:
+            list(ex.map(make_copy, installs[1:]))
 
     print("\nInstalled VM(s):")
     for pkg, name in installs: